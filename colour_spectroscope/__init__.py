@@ -45,12 +45,15 @@ __version__ = '.'.join(
      __minor_version__,
      __change_version__))  # yapf: disable
 
-try:
-    version = subprocess.check_output(
-        ['git', 'describe'], cwd=os.path.dirname(__file__)).strip()
-    version = version.decode('utf-8')
-except Exception:
-    version = __version__
+version = __version__
+# Only spawning *git* when running from a repository checkout.
+if os.path.exists(os.path.join(os.path.dirname(__file__), '..', '.git')):
+    try:
+        version = subprocess.check_output(
+            ['git', 'describe'], cwd=os.path.dirname(__file__)).strip()
+        version = version.decode('utf-8')
+    except Exception:
+        pass
 
 colour.utilities.ANCILLARY_COLOUR_SCIENCE_PACKAGES[
     'colour-spectroscope'] = version
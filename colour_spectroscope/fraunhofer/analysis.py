@@ -14,11 +14,10 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 import scipy.ndimage
+from functools import lru_cache
 
-from colour import (Extrapolator, LinearInterpolator, RGB_COLOURSPACES,
-                    RGB_luminance, SpectralDistribution,
-                    MultiSpectralDistributions)
-from colour.utilities import tstack
+from colour import (RGB_COLOURSPACES, SpectralDistribution,
+                    MultiSpectralDistributions, normalised_primary_matrix)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
@@ -79,6 +78,39 @@ MultiSpectralDistributions or array_like or dict_like, optional
             data, domain, labels=('R', 'G', 'B'), **kwargs)
 
 
+def _linear_interpolation(x, xp, fp):
+    """
+    Linearly interpolates given :math:`x` values using given :math:`x_p` and
+    :math:`f_p` data points, values outside the :math:`x_p` domain are linearly
+    extrapolated using the first and last two data points.
+
+    Parameters
+    ----------
+    x : array_like
+        :math:`x` values to evaluate the interpolant at.
+    xp : array_like
+        Increasing :math:`x_p` values of the data points.
+    fp : array_like
+        :math:`f_p` values of the data points.
+
+    Returns
+    -------
+    ndarray
+        Interpolated and extrapolated values.
+    """
+
+    x, xp, fp = np.asarray(x), np.asarray(xp), np.asarray(fp)
+
+    f = np.interp(x, xp, fp)
+
+    below, above = x < xp[0], x > xp[-1]
+    f[below] = fp[0] + (x[below] - xp[0]) * (fp[1] - fp[0]) / (xp[1] - xp[0])
+    f[above] = fp[-1] + (x[above] - xp[-1]) * (fp[-1] - fp[-2]) / (
+        xp[-1] - xp[-2])
+
+    return f
+
+
 def image_profile(image, line, samples=None):
     """
     Returns the image profile using given line coordinates and given samples
@@ -98,6 +130,10 @@ def image_profile(image, line, samples=None):
     ndarray
         Profile.
 
+    Notes
+    -----
+    -   The image is bilinearly interpolated along the line.
+
     References
     ----------
     .. [2]  http://stackoverflow.com/a/7880726/931625
@@ -108,15 +144,80 @@ def image_profile(image, line, samples=None):
     samples = samples if samples else width
     x0, y0, x1, y1 = line
 
-    profile = []
-    for i in range(channels):
-        x, y = np.linspace(x0, x1, samples), np.linspace(y0, y1, samples)
-        z = image[:, :, i]
+    # A full width horizontal line sampled once per pixel falls exactly on the
+    # image pixels, the row is thus returned without any interpolation.
+    if (y0 == y1 and int(y0) == y0 and 0 <= y0 < height and x0 == 0 and
+            x1 == width - 1 and samples == width):
+        return np.array(image[int(y0):int(y0) + 1, :, :], dtype=np.float32)
+
+    x, y = np.linspace(x0, x1, samples), np.linspace(y0, y1, samples)
+
+    # Sampling all the channels at once with the channel axis moved first,
+    # bilinear interpolation is exact along the integer channel coordinates.
+    coordinates = np.vstack([
+        np.repeat(np.arange(channels), samples),
+        np.tile(y, channels),
+        np.tile(x, channels),
+    ])
+    profile = scipy.ndimage.map_coordinates(
+        np.moveaxis(image, 2, 0), coordinates, order=1)
+
+    return np.transpose(
+        np.reshape(profile, (channels, samples)).astype(np.float32))[
+            np.newaxis]
+
 
-        profile.append(
-            scipy.ndimage.map_coordinates(np.transpose(z), np.vstack([x, y])))
+@lru_cache(maxsize=8)
+def _calibration_coefficients(width, r, m, samples):
+    """
+    Returns the calibration wavelengths and the profile interpolation indexes
+    and weights for given profile width, reference and measured lines and
+    samples count.
+
+    Parameters
+    ----------
+    width : int
+        Profile width.
+    r : tuple
+        Reference lines wavelengths sorted by measured pixels values.
+    m : tuple
+        Measured lines pixels values sorted in ascending order.
+    samples : int
+        Profile samples count.
+
+    Returns
+    -------
+    tuple
+        Read-only wavelengths, interpolation indexes and weights.
+    """
+
+    r, m = np.array(r), np.array(m)
 
-    return np.dstack(profile)
+    # Affine transformation from measured range to reference range.
+    m_to_r_slope = (max(r) - min(r)) / (max(m) - min(m))
+    m_to_r_intercept = min(r) - m_to_r_slope * min(m)
+
+    wavelengths = np.linspace(m_to_r_intercept,
+                              m_to_r_slope * width + m_to_r_intercept, samples)
+
+    # Profile pixels matching the wavelengths, with 2 lines the mapping is a
+    # single affine transformation.
+    if len(r) == 2:
+        r_to_m_slope = (m[-1] - m[0]) / (r[-1] - r[0])
+        pixels = r_to_m_slope * (wavelengths - r[0]) + m[0]
+    else:
+        pixels = _linear_interpolation(wavelengths, r, m)
+
+    # Colors interpolation, the profile pixels being uniformly spaced, the
+    # interval indexes and weights are shared by all the channels. Clipping
+    # the indexes linearly extrapolates using the first and last two pixels.
+    indexes = np.clip(np.floor(pixels).astype(np.int_), 0, width - 2)
+    weights = (pixels - indexes)[..., np.newaxis].astype(np.float32)
+
+    for array in (wavelengths, indexes, weights):
+        array.setflags(write=False)
+
+    return wavelengths, indexes, weights
 
 
 def calibrate_RGB_spectrum_profile(profile, reference, measured, samples=None):
@@ -153,38 +254,14 @@ def calibrate_RGB_spectrum_profile(profile, reference, measured, samples=None):
     # Measured samples.
     m = np.array([measured.get(sample) for sample in measured_lines])
 
-    # Reference range array.
-    rr = np.linspace(min(r), max(r))
-    # Measured range array.
-    mm = np.linspace(min(m), max(m))
+    wavelengths, indexes, weights = _calibration_coefficients(
+        profile.shape[1], tuple(r), tuple(m), samples)
 
-    # Interpolator from reference to measured.
-    r_to_m_interpolator = Extrapolator(LinearInterpolator(r, m))
+    profile = np.asarray(profile[0, :, :3], dtype=np.float32)
+    RGB = profile[indexes] + (
+        profile[indexes + 1] - profile[indexes]) * weights
 
-    # Interpolator from measured range to reference range.
-    mm_to_rr_interpolator = Extrapolator(LinearInterpolator(mm, rr))
-
-    # Colors interpolator.
-    R_interpolator = Extrapolator(
-        LinearInterpolator(np.arange(0, profile.shape[1]), profile[0, :, 0]))
-    G_interpolator = Extrapolator(
-        LinearInterpolator(np.arange(0, profile.shape[1]), profile[0, :, 1]))
-    B_interpolator = Extrapolator(
-        LinearInterpolator(np.arange(0, profile.shape[1]), profile[0, :, 2]))
-
-    wavelengths = np.linspace(
-        mm_to_rr_interpolator([0]), mm_to_rr_interpolator([profile.shape[1]]),
-        samples)
-
-    return RGB_Spectrum(
-        dict(
-            zip(wavelengths,
-                tstack([
-                    R_interpolator(r_to_m_interpolator(wavelengths)),
-                    G_interpolator(r_to_m_interpolator(wavelengths)),
-                    B_interpolator(r_to_m_interpolator(wavelengths))
-                ]))),
-        name='RGB Spectrum')
+    return RGB_Spectrum(RGB, np.copy(wavelengths), name='RGB Spectrum')
 
 
 def calibrated_RGB_spectrum(image, reference, measured, samples=None):
@@ -210,8 +287,13 @@ def calibrated_RGB_spectrum(image, reference, measured, samples=None):
     """
 
     samples = samples if samples else image.shape[1]
-    profile = image_profile(
-        image, line=[0, 0, image.shape[1] - 1, 0], samples=samples)
+
+    # Sampling the first row once per pixel is equivalent to viewing it.
+    if samples == image.shape[1]:
+        profile = image[0:1, :, :]
+    else:
+        profile = image_profile(
+            image, line=[0, 0, image.shape[1] - 1, 0], samples=samples)
 
     return calibrate_RGB_spectrum_profile(
         profile=profile,
@@ -238,10 +320,16 @@ def luminance_sd(spectrum, colourspace=RGB_COLOURSPACES['sRGB']):
         and normalised to [0, 100] domain.
     """
 
-    spectrum = spectrum.copy().normalise(100)
-    luminance = lambda x: RGB_luminance(x, colourspace.primaries, colourspace.
-                                        whitepoint)
+    # Normalising each channel to [0, 100] as
+    # :meth:`colour.MultiSpectralDistributions.normalise` does.
+    values = spectrum.values
+    values = values * (100 / np.max(values, axis=0))
+
+    # The luminance is the second row of the normalised primary matrix.
+    Y = np.dot(
+        values,
+        normalised_primary_matrix(colourspace.primaries,
+                                  colourspace.whitepoint)[1])
 
     return SpectralDistribution(
-        dict(zip(spectrum.wavelengths, luminance(spectrum.values))),
-        name='calibrated_RGB_spectrum')
+        Y, spectrum.wavelengths, name='calibrated_RGB_spectrum')
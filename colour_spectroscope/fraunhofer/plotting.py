@@ -13,8 +13,6 @@ References
 
 from __future__ import division, unicode_literals
 
-import bisect
-import matplotlib.pyplot as plt
 import numpy as np
 import re
 
@@ -34,7 +32,8 @@ __status__ = 'Production'
 __all__ = [
     'FRAUNHOFER_LINES_PUBLISHED', 'FRAUNHOFER_LINES_ELEMENTS_MAPPING',
     'FRAUNHOFER_LINES_NOTABLE', 'FRAUNHOFER_LINES_CLUSTERED',
-    'FRAUNHOFER_LINES_MEASURED', 'fraunhofer_lines_plot'
+    'FRAUNHOFER_LINES_MEASURED', 'FRAUNHOFER_LINES_SORTED_LABELS',
+    'FRAUNHOFER_LINES_SORTED_WAVELENGTHS', 'fraunhofer_lines_plot'
 ]
 
 FRAUNHOFER_LINES_PUBLISHED = {
@@ -124,6 +123,12 @@ FRAUNHOFER_LINES_CLUSTERED = {
     'D[1-3]': ('D3', ('D2', 'D1'), 'D\n3-1')
 }
 
+_FRAUNHOFER_LINES_CLUSTERED_PATTERNS = [
+    (re.compile(pattern), first, set(siblings), specific_label)
+    for pattern, (first, siblings,
+                  specific_label) in FRAUNHOFER_LINES_CLUSTERED.items()
+]
+
 FRAUNHOFER_LINES_MEASURED = {
     'G': 134,
     'F': 371,
@@ -134,6 +139,14 @@ FRAUNHOFER_LINES_MEASURED = {
     'C': 1095
 }
 
+FRAUNHOFER_LINES_SORTED_LABELS = np.array(
+    sorted(FRAUNHOFER_LINES_PUBLISHED, key=FRAUNHOFER_LINES_PUBLISHED.get))
+
+FRAUNHOFER_LINES_SORTED_WAVELENGTHS = np.array([
+    FRAUNHOFER_LINES_PUBLISHED[line]
+    for line in FRAUNHOFER_LINES_SORTED_LABELS
+])
+
 
 @override_style()
 def fraunhofer_lines_plot(image,
@@ -173,77 +186,73 @@ def fraunhofer_lines_plot(image,
                                        measured_Fraunhofer_lines)
 
     wavelengths = spectrum.wavelengths
-    input, output = wavelengths[0], wavelengths[-1]
+    input, output = float(wavelengths[0]), float(wavelengths[-1])
 
     width, height = figure.get_size_inches()
     ratio = width / height
     height = (output - input) * (1 / ratio)
 
+    # The spectrum values are a new array that can be clipped in place.
+    RGB = spectrum.values
+    np.clip(RGB, 0, 1, out=RGB)
+
     axes.imshow(
         COLOUR_STYLE_CONSTANTS.colour.colourspace.cctf_encoding(
-            np.clip(spectrum.values[None, ...], 0, 1)),
+            RGB[np.newaxis, ...]),
         extent=[input, output, 0, height])
 
     sd = luminance_sd(spectrum).normalise(height - height * 0.05)
+    sd_values = sd.values
     if show_luminance_spd:
-        axes.plot(sd.wavelengths, sd.values, color='black', linewidth=1)
-
-    fraunhofer_wavelengths = np.array(
-        sorted(FRAUNHOFER_LINES_PUBLISHED.values()))
-    fraunhofer_wavelengths = fraunhofer_wavelengths[np.where(
-        np.logical_and(fraunhofer_wavelengths >= input,
-                       fraunhofer_wavelengths <= output))]
-    fraunhofer_lines_labels = [
-        tuple(FRAUNHOFER_LINES_PUBLISHED.keys())[tuple(
-            FRAUNHOFER_LINES_PUBLISHED.values()).index(i)]
-        for i in fraunhofer_wavelengths
-    ]
-
-    y0, y1 = 0, height * .5
-    for i, label in enumerate(fraunhofer_lines_labels):
-
-        # Trick to cluster siblings *Fraunhofer* lines.
-        from_siblings = False
-        for pattern, (first, siblings,
-                      specific_label) in FRAUNHOFER_LINES_CLUSTERED.items():
-            if re.match(pattern, label):
+        axes.plot(wavelengths, sd_values, color='black', linewidth=1)
+
+    mask = ((FRAUNHOFER_LINES_SORTED_WAVELENGTHS >= input) &
+            (FRAUNHOFER_LINES_SORTED_WAVELENGTHS <= output))
+    fraunhofer_wavelengths = FRAUNHOFER_LINES_SORTED_WAVELENGTHS[mask]
+    fraunhofer_lines_labels = FRAUNHOFER_LINES_SORTED_LABELS[mask].tolist()
+
+    powers = np.searchsorted(wavelengths, fraunhofer_wavelengths)
+    scales = sd_values[powers] / height
+
+    # Trick to cluster siblings *Fraunhofer* lines.
+    labels, from_siblings = [], []
+    for label in fraunhofer_lines_labels:
+        is_from_siblings = False
+        for (pattern, first, siblings,
+             specific_label) in _FRAUNHOFER_LINES_CLUSTERED_PATTERNS:
+            if pattern.match(label):
                 if label in siblings:
-                    from_siblings = True
+                    is_from_siblings = True
 
                 label = specific_label
                 break
 
-        power = bisect.bisect_left(wavelengths, fraunhofer_wavelengths[i])
-        scale = (sd[wavelengths[power]] / height)
+        labels.append(label)
+        from_siblings.append(is_from_siblings)
 
-        is_large_line = label in FRAUNHOFER_LINES_NOTABLE
+    y0, y1 = 0, height * .5
 
-        axes.vlines(
-            fraunhofer_wavelengths[i],
-            y0,
-            y1 * scale,
-            linewidth=1 if is_large_line else 1)
+    axes.vlines(fraunhofer_wavelengths, y0, y1 * scales, linewidth=1)
+    axes.vlines(fraunhofer_wavelengths, y0, height, linewidth=1, alpha=0.075)
+
+    for i, label in enumerate(labels):
+        if from_siblings[i]:
+            continue
+
+        is_large_line = label in FRAUNHOFER_LINES_NOTABLE
 
-        axes.vlines(
+        axes.text(
             fraunhofer_wavelengths[i],
-            y0,
-            height,
-            linewidth=1 if is_large_line else 1,
-            alpha=0.075)
-
-        if not from_siblings:
-            axes.text(
-                fraunhofer_wavelengths[i],
-                y1 * scale + (y1 * 0.025),
-                label,
-                clip_on=True,
-                ha='center',
-                va='bottom',
-                fontdict={'size': 'large' if is_large_line else 'small'})
+            y1 * scales[i] + (y1 * 0.025),
+            label,
+            clip_on=True,
+            ha='center',
+            va='bottom',
+            fontdict={'size': 'large' if is_large_line else 'small'})
 
     r = lambda x: int(x / 100) * 100
-    plt.xticks(np.arange(r(input), r(output * 1.5), 20))
-    plt.yticks([])
+    axes.set_xticks(np.arange(r(input), r(output * 1.5), 20))
+    axes.set_yticks([])
 
     settings = {
         'title': 'The Solar Spectrum - Fraunhofer Lines',
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour_spectroscope.fraunhofer.analysis` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour import (Extrapolator, LinearInterpolator, RGB_COLOURSPACES,
+                    RGB_luminance)
+from colour.utilities import tstack
+
+from colour_spectroscope.fraunhofer.analysis import (
+    RGB_Spectrum, _calibration_coefficients, calibrate_RGB_spectrum_profile,
+    luminance_sd)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2021 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['TestCalibrateRGBSpectrumProfile', 'TestLuminanceSd']
+
+
+def _calibrate_RGB_spectrum_profile_reference(profile,
+                                              reference,
+                                              measured,
+                                              samples=None):
+    """
+    Calibrates given spectrum profile in double precision using the
+    :class:`colour.LinearInterpolator` class based reference implementation.
+    """
+
+    samples = samples if samples else profile.shape[1]
+    measured_lines = [
+        line for line, value in sorted(measured.items(), key=lambda x: x[1])
+    ]
+
+    r = np.array([reference.get(sample) for sample in measured_lines])
+    m = np.array([measured.get(sample) for sample in measured_lines])
+
+    rr = np.linspace(min(r), max(r))
+    mm = np.linspace(min(m), max(m))
+
+    r_to_m_interpolator = Extrapolator(LinearInterpolator(r, m))
+    mm_to_rr_interpolator = Extrapolator(LinearInterpolator(mm, rr))
+
+    wavelengths = np.linspace(
+        mm_to_rr_interpolator(0), mm_to_rr_interpolator(profile.shape[1]),
+        samples)
+    pixels = r_to_m_interpolator(wavelengths)
+
+    x = np.arange(0, profile.shape[1])
+    RGB = tstack([
+        Extrapolator(LinearInterpolator(x, profile[0, :, i]))(pixels)
+        for i in range(3)
+    ])
+
+    return wavelengths, RGB
+
+
+class TestCalibrateRGBSpectrumProfile(unittest.TestCase):
+    """
+    Defines :func:`colour_spectroscope.fraunhofer.analysis.\
+calibrate_RGB_spectrum_profile` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._profile = np.random.RandomState(4).random_sample((1, 100, 3))
+
+        # The outer segments are steeper than the overall calibration so that
+        # the first and last wavelengths map outside the profile.
+        self._reference = {'A': 400, 'B': 410, 'C': 590, 'D': 600}
+        self._measured = {'A': 10, 'B': 20, 'C': 80, 'D': 90}
+
+    def test_calibrate_RGB_spectrum_profile(self):
+        """
+        Tests :func:`colour_spectroscope.fraunhofer.analysis.\
+calibrate_RGB_spectrum_profile` definition.
+        """
+
+        spectrum = calibrate_RGB_spectrum_profile(
+            self._profile, self._reference, self._measured)
+        wavelengths, RGB = _calibrate_RGB_spectrum_profile_reference(
+            self._profile, self._reference, self._measured)
+
+        # The single precision profile interpolation is expected to match the
+        # double precision reference implementation, the error grows with the
+        # extrapolation distance beyond the profile edges.
+        np.testing.assert_almost_equal(
+            spectrum.wavelengths, wavelengths, decimal=7)
+        np.testing.assert_almost_equal(spectrum.values, RGB, decimal=5)
+
+    def test_extrapolation_calibrate_RGB_spectrum_profile(self):
+        """
+        Tests :func:`colour_spectroscope.fraunhofer.analysis.\
+calibrate_RGB_spectrum_profile` definition extrapolation beyond the profile
+        edges and the measured lines.
+        """
+
+        r = tuple(sorted(self._reference.values()))
+        m = tuple(sorted(self._measured.values()))
+        wavelengths, indexes, weights = _calibration_coefficients(
+            self._profile.shape[1], r, m, self._profile.shape[1])
+
+        # The first and last pixels are beyond both profile edges.
+        self.assertEqual(indexes[0], 0)
+        self.assertLess(weights[0, 0], 0)
+        self.assertEqual(indexes[-1], self._profile.shape[1] - 2)
+        self.assertGreater(weights[-1, 0], 1)
+
+        for samples in (50, 100, 200):
+            spectrum = calibrate_RGB_spectrum_profile(
+                self._profile, self._reference, self._measured, samples)
+            wavelengths, RGB = _calibrate_RGB_spectrum_profile_reference(
+                self._profile, self._reference, self._measured, samples)
+
+            np.testing.assert_almost_equal(
+                spectrum.wavelengths, wavelengths, decimal=7)
+            np.testing.assert_almost_equal(spectrum.values, RGB, decimal=5)
+
+    def test_2_lines_calibrate_RGB_spectrum_profile(self):
+        """
+        Tests :func:`colour_spectroscope.fraunhofer.analysis.\
+calibrate_RGB_spectrum_profile` definition with 2 measured lines.
+        """
+
+        reference = {'A': 450, 'D': 600}
+        measured = {'A': 30, 'D': 90}
+
+        for samples in (50, 100, 200):
+            spectrum = calibrate_RGB_spectrum_profile(
+                self._profile, reference, measured, samples)
+            wavelengths, RGB = _calibrate_RGB_spectrum_profile_reference(
+                self._profile, reference, measured, samples)
+
+            np.testing.assert_almost_equal(
+                spectrum.wavelengths, wavelengths, decimal=7)
+            np.testing.assert_almost_equal(spectrum.values, RGB, decimal=5)
+
+    def test_cache_calibrate_RGB_spectrum_profile(self):
+        """
+        Tests :func:`colour_spectroscope.fraunhofer.analysis.\
+calibrate_RGB_spectrum_profile` definition cached calibration coefficients.
+        """
+
+        spectrum_1 = calibrate_RGB_spectrum_profile(
+            self._profile, self._reference, self._measured)
+        spectrum_1.normalise(100)
+        spectrum_2 = calibrate_RGB_spectrum_profile(
+            self._profile, self._reference, self._measured)
+        spectrum_3 = calibrate_RGB_spectrum_profile(
+            self._profile, self._reference, self._measured)
+
+        np.testing.assert_equal(spectrum_2.wavelengths, spectrum_3.wavelengths)
+        np.testing.assert_equal(spectrum_2.values, spectrum_3.values)
+
+        wavelengths, RGB = _calibrate_RGB_spectrum_profile_reference(
+            self._profile, self._reference, self._measured)
+        np.testing.assert_almost_equal(
+            spectrum_3.wavelengths, wavelengths, decimal=7)
+        np.testing.assert_almost_equal(spectrum_3.values, RGB, decimal=5)
+
+        r = tuple(sorted(self._reference.values()))
+        m = tuple(sorted(self._measured.values()))
+        for array in _calibration_coefficients(self._profile.shape[1], r, m,
+                                               self._profile.shape[1]):
+            self.assertFalse(array.flags.writeable)
+
+        # The coefficients are shared by profiles with the same geometry.
+        profile = self._profile[..., ::-1]
+        spectrum = calibrate_RGB_spectrum_profile(profile, self._reference,
+                                                  self._measured)
+        wavelengths, RGB = _calibrate_RGB_spectrum_profile_reference(
+            profile, self._reference, self._measured)
+        np.testing.assert_almost_equal(spectrum.values, RGB, decimal=5)
+
+
+class TestLuminanceSd(unittest.TestCase):
+    """
+    Defines :func:`colour_spectroscope.fraunhofer.analysis.luminance_sd`
+    definition unit tests methods.
+    """
+
+    def test_luminance_sd(self):
+        """
+        Tests :func:`colour_spectroscope.fraunhofer.analysis.luminance_sd`
+        definition.
+        """
+
+        wavelengths = np.linspace(380, 780, 41)
+        RGB = np.transpose([
+            np.linspace(0.1, 0.9, 41),
+            np.sin(np.linspace(0, np.pi, 41)) * 0.5,
+            np.linspace(0.2, 0.05, 41),
+        ])
+        spectrum = RGB_Spectrum(RGB, wavelengths)
+        colourspace = RGB_COLOURSPACES['sRGB']
+
+        # Reference implementation normalising a copy of the spectrum.
+        normalised = spectrum.copy().normalise(100)
+        Y = RGB_luminance(normalised.values, colourspace.primaries,
+                          colourspace.whitepoint)
+
+        sd = luminance_sd(spectrum, colourspace)
+
+        np.testing.assert_almost_equal(sd.wavelengths, wavelengths, decimal=7)
+        np.testing.assert_almost_equal(sd.values, Y, decimal=7)
+        np.testing.assert_almost_equal(spectrum.values, RGB, decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()